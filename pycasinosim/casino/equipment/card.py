@@ -1,16 +1,19 @@
 """
 The card module holds the Face and Rank enum classes, along with the
-Card and Deck data classes.
+Card, Deck, and Shoe classes.
 """
-import secrets
-from dataclasses import dataclass, field
+from collections import deque
 from enum import IntEnum, Enum
-from itertools import product
-from typing import Final, Union, List
-from uuid import uuid4
+from itertools import count
+from random import SystemRandom
+from typing import Deque, Dict, Final, FrozenSet, Optional, Union, List, Set, Tuple
 
 from pycasinosim.exceptions import BadCardError
 
+_CARD_ID: Final[count] = count()
+
+_SYSTEM_RANDOM: Final[SystemRandom] = SystemRandom()
+
 
 class Rank(IntEnum):
     """
@@ -39,7 +42,7 @@ class Rank(IntEnum):
         :return: True if the card is an ACE, JACK, QUEEN, or KING, otherwise
             False.
         """
-        return self.value in [1, 10, 11, 12, 13]
+        return self in _PICTURE_RANKS
 
     @property
     def abbreviation(self) -> str:
@@ -50,9 +53,7 @@ class Rank(IntEnum):
 
         :return: An abbreviated Rank name.
         """
-        if (self.value >= 2) and (self.value <= 10):
-            return str(self.value)
-        return self.name[0]
+        return _RANK_ABBREVIATIONS[self]
 
 
 class Face(IntEnum):
@@ -72,9 +73,7 @@ class Face(IntEnum):
 
         :return: red if the Face is DIAMOND or HEART, otherwise black.
         """
-        if self is Face.DIAMOND or self is Face.HEART:
-            return "red"
-        return "black"
+        return _FACE_COLOURS[self]
 
     @property
     def symbol(self) -> str:
@@ -83,26 +82,100 @@ class Face(IntEnum):
 
         :return: Returns the card face symbol as a string.
         """
-        if self is Face.CLUB:
-            return "♣"
-        elif self is Face.DIAMOND:
-            return "♦"
-        elif self is Face.HEART:
-            return "♥"
-        elif self is Face.SPADE:
-            return "♠"
+        return _FACE_SYMBOLS[self]
+
+
+_PICTURE_RANKS: Final[FrozenSet[Rank]] = frozenset(
+    {Rank.ACE, Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING}
+)
+
+_RANK_ABBREVIATIONS: Final[Dict[Rank, str]] = {
+    Rank.ACE: "A",
+    Rank.TWO: "2",
+    Rank.THREE: "3",
+    Rank.FOUR: "4",
+    Rank.FIVE: "5",
+    Rank.SIX: "6",
+    Rank.SEVEN: "7",
+    Rank.EIGHT: "8",
+    Rank.NINE: "9",
+    Rank.TEN: "10",
+    Rank.JACK: "J",
+    Rank.QUEEN: "Q",
+    Rank.KING: "K",
+}
+
+_FACE_COLOURS: Final[Dict[Face, str]] = {
+    Face.CLUB: "black",
+    Face.DIAMOND: "red",
+    Face.HEART: "red",
+    Face.SPADE: "black",
+}
+
+_FACE_SYMBOLS: Final[Dict[Face, str]] = {
+    Face.CLUB: "♣",
+    Face.DIAMOND: "♦",
+    Face.HEART: "♥",
+    Face.SPADE: "♠",
+}
+
+
+_DECK_TEMPLATE: Final[Tuple[Tuple[Rank, Face], ...]] = tuple(
+    (r, f) for f in Face for r in Rank
+)
+
+_PACKED_DECK: Final[bytes] = bytes((r << 2) | (f - 1) for r, f in _DECK_TEMPLATE)
+
+_UNPACKED: Final[Dict[int, Tuple[Rank, Face]]] = {
+    (r << 2) | (f - 1): (r, f) for r, f in _DECK_TEMPLATE
+}
+
+_CARD_ABBREVIATIONS: Final[Dict[Tuple[Rank, Face], str]] = {
+    (r, f): f"{_RANK_ABBREVIATIONS[r]}{_FACE_SYMBOLS[f]}" for r, f in _DECK_TEMPLATE
+}
 
 
-@dataclass(frozen=True)
 class Card:
     """
-    The Card class is a frozen dataclass that takes a Rank and a
-    Face. Each instance of Card is assigned an uuid as a string.
+    The Card class is a frozen, slotted class that takes a Rank and a
+    Face. Each instance of Card is assigned a unique int as its uuid, and
+    Cards are compared and hashed by their uuid.
     """
 
-    rank: Rank
-    face: Face
-    uuid: str = field(default_factory=lambda: str(uuid4()))
+    __slots__ = ("rank", "face", "uuid")
+
+    def __init__(self, rank: Rank, face: Face, uuid: Optional[int] = None):
+        """
+        Creates a new instance of Card with a Rank, a Face, and an optional
+        uuid. A new unique uuid is assigned when one is not given.
+
+        :param rank: The Rank of the Card.
+        :param face: The Face of the Card.
+        :param uuid: The uuid of the Card. Has a default value of None.
+        """
+        _set_card_rank(self, rank)
+        _set_card_face(self, face)
+        _set_card_uuid(self, uuid if uuid is not None else next(_CARD_ID))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}' of a frozen Card")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete field '{name}' of a frozen Card")
+
+    def __reduce__(self):
+        return Card, (self.rank, self.face, self.uuid)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.uuid == other.uuid
+
+    def __hash__(self) -> int:
+        return hash(self.uuid)
+
+    def __repr__(self) -> str:
+        return f"Card(rank={self.rank!r}, face={self.face!r}, uuid={self.uuid!r})"
 
     @property
     def abbreviation(self) -> str:
@@ -112,7 +185,27 @@ class Card:
 
         :return: The Card abbreviation as a string.
         """
-        return f"{self.rank.abbreviation}{self.face.symbol}"
+        return _CARD_ABBREVIATIONS[(self.rank, self.face)]
+
+
+# The slot descriptors' setters bypass the frozen Card.__setattr__, and
+# are cheaper to call than object.__setattr__.
+_set_card_rank = Card.rank.__set__
+_set_card_face = Card.face.__set__
+_set_card_uuid = Card.uuid.__set__
+
+
+def _unpack(packed: int) -> Card:
+    """
+    Creates a new instance of Card from a packed card byte, where the Rank
+    value is held in the upper bits and the Face value, less one, is held
+    in the lowest two bits. The Rank and Face are looked up in the unpacked
+    table rather than decoded.
+
+    :param packed: A packed card byte from the packed deck template.
+    :return: A new instance of Card.
+    """
+    return Card(*_UNPACKED[packed])
 
 
 class CardShuffle(Enum):
@@ -142,28 +235,23 @@ class Deck:
         if card_shuffle is not None and not isinstance(card_shuffle, CardShuffle):
             raise TypeError("The shuffle parameter must be of type CardShuffle")
         self.shuffle: Final[CardShuffle] = card_shuffle
-        self._cards: List[Card] = [
-            Card(card[1], card[0]) for card in product(list(Face), list(Rank))
-        ]
+        self._cards: Deque[Card] = deque(Card(r, f) for r, f in _DECK_TEMPLATE)
         self._shuffled = False
         self._shuffle_cards()
 
     def _shuffle_cards(self):
         """
-        Performs the shuffle at a deck level by drawing truly random cards
-        from the deck and placing them in a new deck list until the original
-        deck is empty. The new deck list is then assigned to the _cards
-        variable.
+        Performs the shuffle at a deck level by shuffling a list copy of the
+        cards with the operating system's random source, which then becomes
+        the new cards deque.
         """
         if not self._shuffled and (
             self.shuffle == CardShuffle.DECK
             or self.shuffle == CardShuffle.DECK_AND_SHOE
         ):
-            shuffled_cards = []
-            while self.can_draw_card:
-                i = secrets.choice(range(0, self.cards_remaining))
-                shuffled_cards.append(self._cards.pop(i))
-            self._cards = shuffled_cards
+            cards = list(self._cards)
+            _SYSTEM_RANDOM.shuffle(cards)
+            self._cards = deque(cards)
             self._shuffled = True
 
     def draw_card(self) -> Union[Card, None]:
@@ -173,10 +261,20 @@ class Deck:
         :return: Either an instance of Card, or None.
         """
         if self.can_draw_card:
-            return self._cards.pop(0)
+            return self._cards.popleft()
         else:
             return None
 
+    @property
+    def cards(self) -> List[Card]:
+        """
+        Returns a shallow copy of the remaining cards in draw order, without
+        drawing them from the Deck.
+
+        :return: A list of Cards.
+        """
+        return list(self._cards)
+
     @property
     def can_draw_card(self) -> bool:
         """
@@ -217,14 +315,19 @@ class Shoe:
     A class that represents the Shoe on a card table. The shoe performs all
     drawing of cards and overdrawn card replacement. The shoe prevents 'bad
     cards' from being placed into the shoe.
+
+    The cards in the shoe are held as one packed byte per card, and an
+    instance of Card is only created when a card is drawn. A shuffled
+    shoe is shuffled lazily, one card at a time as the cards are drawn.
     """
 
     def __init__(self, decks: int, card_shuffle: CardShuffle = None):
         """
         Creates a new instance of Shoe with a number of decks and an
         optional card shuffle. Decks must be an integer and be greater than
-        0. Shuffles the card array if the CardShuffle is either Shoe or
-        DeckAndShoe.
+        0. No cards are shuffled at construction unless the CardShuffle is
+        Deck, in which case each Deck is shuffled on its own. A Shoe or
+        DeckAndShoe shuffle is performed lazily as the cards are drawn.
 
         :param decks: The number of decks in the shoe.
         :param card_shuffle: The type of shuffle the Shoe will perform. Has
@@ -243,9 +346,11 @@ class Shoe:
             raise ValueError("Decks must be greater than 1")
         self.shuffle: Final[CardShuffle] = card_shuffle
         self.decks: Final[int] = decks
-        self._cards: List[Card] = []
-        self._overdrawn_cards: List[Card] = []
-        self._card_uuids: List[str] = []
+        self._packed: bytearray = bytearray()
+        self._cursor: int = 0
+        self._overdrawn_cards: Deque[Card] = deque()
+        self._card_uuids: Set[int] = set()
+        self._overdrawn_uuids: Set[int] = set()
         self._shoe_populated: bool = False
         self._populate_shoe()
         self._shuffled: bool = False
@@ -253,18 +358,16 @@ class Shoe:
 
     def _shuffle_cards(self):
         """
-        Performs the shuffle if the Deck has not already been shuffled, and if
-        the shuffle is equal to either SHOE or DECK_AND_SHOE.
+        Marks the Shoe as shuffled if it has not already been shuffled, and
+        if the shuffle is equal to either SHOE or DECK_AND_SHOE. No cards
+        are moved here, instead each draw from a shuffled Shoe performs one
+        step of a Fisher-Yates shuffle, so only the cards that are drawn
+        are ever shuffled.
         """
         if not self._shuffled and (
             self.shuffle == CardShuffle.SHOE
             or self.shuffle == CardShuffle.DECK_AND_SHOE
         ):
-            shuffled_cards = []
-            while self.can_draw_card:
-                i = secrets.choice(range(0, self.cards_remaining))
-                shuffled_cards.append(self._cards.pop(i))
-            self._cards = shuffled_cards
             self._shuffled = True
 
     @property
@@ -278,29 +381,30 @@ class Shoe:
 
     def _populate_shoe(self) -> None:
         """
-        Iterates over a range of the number of Decks, creating a new
-        instance of Deck each time. The Cards from each Deck are drawn and
-        appended to the cards list, maintaining their (shuffled or
-        un-shuffled) deck order. The uuid of each card is appended to the
-        card uuids list.
+        Fills the packed cards with one run of the packed deck template for
+        every Deck in the Shoe. If the shuffle is DECK, each Deck's run is
+        shuffled on its own, maintaining the deck boundaries. Under
+        DECK_AND_SHOE the runs are left in order, as the lazy shoe shuffle
+        is uniform whatever order the cards start in.
         """
         if not self._shoe_populated:
-            for i in range(0, self.decks):
-                d = Deck(self.shuffle)
-                for c in d:
-                    self._card_uuids.append(c.uuid)
-                    self._cards.append(c)
+            for _ in range(self.decks):
+                deck = bytearray(_PACKED_DECK)
+                if self.shuffle == CardShuffle.DECK:
+                    _SYSTEM_RANDOM.shuffle(deck)
+                self._packed.extend(deck)
             self._shoe_populated = True
 
     def replace_overdrawn_card(self, card: Card) -> None:
         """
-        Appends the card to the list of overdrawn cards.
+        Appends the card to the deque of overdrawn cards, and adds its uuid to
+        the overdrawn uuids set.
 
         :param card: An instance of Card.
 
         :raise TypeError: When the card is not of type Card.
-        :raises BadCardError: When the UUID of the card is None or is not
-        listed in the uuids list.
+        :raises BadCardError: When the UUID of the card is None or the card
+        was not drawn from this shoe.
         :raises BadCardError: When the card has already been placed back
         into the shoe.
         """
@@ -317,11 +421,14 @@ class Shoe:
                 "already in the shoe"
             )
         self._overdrawn_cards.append(card)
+        self._overdrawn_uuids.add(card.uuid)
 
     def _is_card_in_shoe(self, card: Card) -> bool:
         """
-        Return True if the uuid of the given card is in the cards or
-        overdrawn_cards list, otherwise returns False.
+        Return True if the uuid of the given card is in the overdrawn uuids
+        set, otherwise returns False. Cards that have not yet been drawn
+        have no instance of Card, so only overdrawn cards can be in the
+        shoe.
 
         :param card: An instance of Card.
         :return: A bool.
@@ -330,14 +437,12 @@ class Shoe:
         """
         if not isinstance(card, Card):
             raise TypeError("The card parameter must be of type Card")
-        return any(c.uuid == card.uuid for c in self._cards) or any(
-            c.uuid == card.uuid for c in self._overdrawn_cards
-        )
+        return card.uuid in self._overdrawn_uuids
 
     @property
     def _use_overdrawn_card(self) -> bool:
         """
-        Returns True if the length of the list of overdrawn cards is greater
+        Returns True if the length of the deque of overdrawn cards is greater
         than 0, otherwise returns False.
 
         :return: A bool.
@@ -346,20 +451,27 @@ class Shoe:
 
     def _draw_overdrawn_card(self) -> Union[Card, None]:
         """
-        If there are overdrawn cards, a Card is popped from 0 and returned.
+        If there are overdrawn cards, a Card is popped from the left, its uuid is
+        discarded from the overdrawn uuids set, and it is returned.
 
         :return: A card, or None.
         """
         if self._use_overdrawn_card:
-            return self._overdrawn_cards.pop(0)
+            card = self._overdrawn_cards.popleft()
+            self._overdrawn_uuids.discard(card.uuid)
+            return card
         else:
             return None
 
     def draw_card(self) -> Union[Card, None]:
         """
         First checks if there are overdrawn cards, if so, calls the draw
-        overdrawn card function, otherwise if a card can be drawn from the
-        cards list, it is drawn and returned.
+        overdrawn card function, otherwise if a card can be drawn, the packed
+        card at the cursor is drawn and unpacked into a new instance of Card.
+        If the Shoe is shuffled, the packed card at the cursor is first
+        swapped with a truly random packed card from those not yet drawn.
+        The uuid of the new card is added to the card uuids set, and the
+        card is returned.
 
         :return: A Card, or None.
         """
@@ -367,29 +479,36 @@ class Shoe:
             return self._draw_overdrawn_card()
         else:
             if self.can_draw_card:
-                return self._cards.pop(0)
+                packed = self._packed
+                cursor = self._cursor
+                if self._shuffled:
+                    j = _SYSTEM_RANDOM.randrange(cursor, len(packed))
+                    packed[cursor], packed[j] = packed[j], packed[cursor]
+                self._cursor = cursor + 1
+                card = _unpack(packed[cursor])
+                self._card_uuids.add(card.uuid)
+                return card
             else:
                 return None
 
     @property
     def can_draw_card(self) -> bool:
         """
-        Returns true if there are cards in the cards or overdrawn cards lists,
+        Returns true if there are undrawn or overdrawn cards remaining,
         otherwise returns false.
 
         :return: A bool.
         """
-        return len(self._cards) > 0 or len(self._overdrawn_cards) > 0
+        return self._cursor < len(self._packed) or len(self._overdrawn_cards) > 0
 
     @property
     def cards_remaining(self) -> int:
         """
-        Returns the combined number of cards in both the cards and overdrawn
-        cards lists.
+        Returns the combined number of undrawn and overdrawn cards.
 
         :return: An int.
         """
-        return len(self._cards) + len(self._overdrawn_cards)
+        return len(self._packed) - self._cursor + len(self._overdrawn_cards)
 
     def __repr__(self) -> str:
         """
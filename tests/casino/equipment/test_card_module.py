@@ -1,3 +1,9 @@
+import copy
+import pickle
+from collections import Counter
+
+import pytest
+
 from pycasinosim.casino.equipment.card import Card, Shoe, CardShuffle
 from pycasinosim.casino.equipment.card import Deck
 from pycasinosim.casino.equipment.card import Face
@@ -18,6 +24,18 @@ def test_rank_abbreviation():
     assert c.rank.abbreviation == "A"
 
 
+def test_number_rank_abbreviation():
+    c = Card(Rank.TEN, Face.CLUB)
+    assert c.rank.abbreviation == "10"
+    assert c.abbreviation == "10♣"
+
+
+def test_rank_is_picture_card():
+    assert Rank.ACE.is_picture_card
+    assert Rank.TEN.is_picture_card
+    assert not Rank.NINE.is_picture_card
+
+
 def test_rank_colour():
     c1 = Card(Rank.ACE, Face.HEART)
     assert c1.face.colour == "red"
@@ -32,6 +50,29 @@ def test_card_eq_by_uuid():
     assert c1 != c2
 
 
+def test_card_is_immutable():
+    c = Card(Rank.ACE, Face.HEART)
+    with pytest.raises(AttributeError):
+        c.rank = Rank.KING
+    with pytest.raises(AttributeError):
+        c.uuid = Card(Rank.ACE, Face.HEART).uuid
+    with pytest.raises(AttributeError):
+        del c.uuid
+    assert c.rank is Rank.ACE
+
+
+def test_card_copy_and_pickle_round_trip():
+    c = Card(Rank.ACE, Face.HEART)
+    for clone in (copy.copy(c), copy.deepcopy(c), pickle.loads(pickle.dumps(c))):
+        assert clone == c
+        assert (clone.rank, clone.face) == (c.rank, c.face)
+
+
+def test_card_has_no_instance_dict():
+    c = Card(Rank.ACE, Face.HEART)
+    assert not hasattr(c, "__dict__")
+
+
 # Deck
 def test_deck_generation():
     d = Deck()
@@ -45,6 +86,20 @@ def test_empty_deck():
     assert d.cards_remaining == 0
 
 
+def test_shuffled_deck_keeps_every_card():
+    d = Deck(CardShuffle.DECK)
+    cards = {(c.rank, c.face) for c in d}
+    assert len(cards) == 52
+
+
+def test_deck_cards_does_not_draw():
+    d = Deck(CardShuffle.DECK)
+    cards = d.cards
+    assert len(cards) == 52
+    assert d.cards_remaining == 52
+    assert d.draw_card() is cards[0]
+
+
 # Shoe
 def test_deck_generation():
     s = Shoe(6, CardShuffle.DECK_AND_SHOE)
@@ -107,3 +162,19 @@ def test_empty_shoe():
     for i in range(312):
         s.draw_card()
     assert s.cards_remaining == 0
+
+
+def test_deck_shuffled_shoe_keeps_deck_boundaries():
+    s = Shoe(2, CardShuffle.DECK)
+    for _ in range(2):
+        cards = {(c.rank, c.face) for c in (s.draw_card() for _ in range(52))}
+        assert len(cards) == 52
+
+
+def test_shuffled_shoe_draws_every_card():
+    s = Shoe(2, CardShuffle.SHOE)
+    cards = [s.draw_card() for _ in range(104)]
+    assert s.draw_card() is None
+    counts = Counter((c.rank, c.face) for c in cards)
+    assert len(counts) == 52
+    assert set(counts.values()) == {2}